@@ -1,5 +1,10 @@
+import os
 import sys
+import shutil
 import string
+import filecmp
+import tempfile
+from functools import lru_cache
 from typing import Dict, Tuple
 
 LOWER = string.ascii_lowercase           # 'a'..'z'
@@ -7,15 +12,18 @@ UPPER = string.ascii_uppercase           # 'A'..'Z'
 LOWER_FIRST, LOWER_SECOND = LOWER[:13], LOWER[13:]   # a-m, n-z
 UPPER_FIRST, UPPER_SECOND = UPPER[:13], UPPER[13:]   # A-M, N-Z
 
+CHUNK_SIZE = 1 << 20  # 1 MiB blocks for streaming file transforms
+
 
 def _shift_within_group(ch: str, shift: int, group: str) -> str:
     """Shift a character within its 13-letter group with wrap-around."""
     n = len(group)  # 13
-    i = group.index(ch)
+    i = ord(ch) - ord(group[0])  # groups are contiguous ASCII runs
     return group[(i + shift) % n]
 
 
-def build_maps(shift1: int, shift2: int) -> Tuple[Dict[str, str], Dict[str, str]]:
+@lru_cache(maxsize=128)
+def build_maps(shift1: int, shift2: int) -> Tuple[bytes, bytes]:
     """
     Build encryption/decryption maps using the rules:
       - lowercase a–m: forward by (shift1 * shift2)
@@ -23,7 +31,8 @@ def build_maps(shift1: int, shift2: int) -> Tuple[Dict[str, str], Dict[str, str]
       - uppercase A–M: backward by shift1
       - uppercase N–Z: forward by (shift2 ** 2)
     Non-letters are left unchanged during transform (handled elsewhere).
-    Returns (enc_map, dec_map).
+    Returns (enc_table, dec_table) as 256-byte tables for bytes.translate.
+    Results are cached per (shift1, shift2); the tables are immutable bytes.
     """
     enc_map: Dict[str, str] = {}
 
@@ -47,38 +56,69 @@ def build_maps(shift1: int, shift2: int) -> Tuple[Dict[str, str], Dict[str, str]
 
     # Inverse mapping for decryption
     dec_map = {v: k for k, v in enc_map.items()}
-    return enc_map, dec_map
+
+    # Convert to 256-byte lookup tables for bytes.translate. Only ASCII letters
+    # are remapped; every other byte (including UTF-8 lead/continuation bytes
+    # >= 0x80) maps to itself, so translating raw UTF-8 is safe.
+    enc_table = bytes.maketrans(''.join(enc_map.keys()).encode('ascii'),
+                                ''.join(enc_map.values()).encode('ascii'))
+    dec_table = bytes.maketrans(''.join(dec_map.keys()).encode('ascii'),
+                                ''.join(dec_map.values()).encode('ascii'))
+    return enc_table, dec_table
+
+
+def transform_text(data: bytes, table: bytes) -> bytes:
+    """Apply the byte translation table, leaving bytes not remapped by it unchanged."""
+    return data.translate(table)
+
+
+def transform_file(input_path: str, output_path: str, table: bytes) -> None:
+    """
+    Stream input_path through the translation table into output_path in
+    CHUNK_SIZE blocks, so memory use stays constant regardless of file size.
+    Translation is stateless per byte, so chunk boundaries are safe.
+    In-place use (input and output are the same file) streams into a
+    temporary file next to it and then replaces the original.
+    """
+    if os.path.exists(output_path) and os.path.samefile(input_path, output_path):
+        target = os.path.realpath(output_path)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target))
+        try:
+            with open(input_path, 'rb', buffering=0) as fi, os.fdopen(fd, 'wb', buffering=CHUNK_SIZE) as fo:
+                _stream_translate(fi, fo, table)
+            shutil.copymode(target, tmp_path)  # mkstemp creates the file as 0600
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return
+
+    with open(input_path, 'rb', buffering=0) as fi, open(output_path, 'wb', buffering=CHUNK_SIZE) as fo:
+        _stream_translate(fi, fo, table)
 
 
-def transform_text(text: str, mapping: Dict[str, str]) -> str:
-    """Apply the single-character mapping, leaving characters not in the map unchanged."""
-    return ''.join(mapping.get(ch, ch) for ch in text)
+def _stream_translate(fi, fo, table: bytes) -> None:
+    """Copy fi to fo in CHUNK_SIZE blocks, translating each block."""
+    while chunk := fi.read(CHUNK_SIZE):
+        fo.write(transform_text(chunk, table))
 
 
 def encrypt_file(input_path: str, output_path: str, shift1: int, shift2: int) -> None:
     """Read plaintext, encrypt, write ciphertext."""
-    enc_map, _ = build_maps(shift1, shift2)
-    with open(input_path, 'r', encoding='utf-8') as f:
-        plain = f.read()
-    cipher = transform_text(plain, enc_map)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(cipher)
+    enc_table, _ = build_maps(shift1, shift2)
+    transform_file(input_path, output_path, enc_table)
 
 
 def decrypt_file(input_path: str, output_path: str, shift1: int, shift2: int) -> None:
     """Read ciphertext, decrypt, write plaintext."""
-    _, dec_map = build_maps(shift1, shift2)
-    with open(input_path, 'r', encoding='utf-8') as f:
-        cipher = f.read()
-    plain = transform_text(cipher, dec_map)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(plain)
+    _, dec_table = build_maps(shift1, shift2)
+    transform_file(input_path, output_path, dec_table)
 
 
 def verify_files(original_path: str, decrypted_path: str) -> bool:
     """Return True if original and decrypted files are byte-for-byte equal."""
-    with open(original_path, 'r', encoding='utf-8') as f1, open(decrypted_path, 'r', encoding='utf-8') as f2:
-        return f1.read() == f2.read()
+    # shallow=False forces a chunked content compare that stops at the first mismatch
+    return filecmp.cmp(original_path, decrypted_path, shallow=False)
 
 
 def main() -> None:
@@ -3,94 +3,172 @@ import os
 import sys
 import math
 import argparse
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
 
-# Optional plotting
+# Optional plotting (Agg backend: we only ever write PNG files)
 try:
+    import matplotlib
+    matplotlib.use("Agg")
     import matplotlib.pyplot as plt
 except Exception:
     plt = None  # Plotting will be skipped gracefully
 
+# Optional numba JIT for the Koch iteration. Importing and compiling it costs
+# about 0.6s while it saves about 0.027s per million segments over the NumPy
+# path, so it is only loaded (lazily) for fractals at least this large.
+NUMBA_MIN_SEGMENTS = 1 << 25
+
+# Above this many points, plot every k-th point; at 200 dpi the skipped
+# vertices are far below pixel spacing and only slow down rendering
+MAX_PLOT_POINTS = 200_000
+
+# +60 degree rotation used for the Koch 'peak', computed once
+_COS60 = 0.5
+_SIN60 = math.sqrt(3) / 2.0
+
 def regular_polygon(n_sides: int, side_len: float):
-    """Return list of (x,y) vertices (closed, last=first) for a regular n-gon with given side length."""
+    """Return an (n_sides+1, 2) array of vertices (closed, last=first) for a regular n-gon with given side length."""
     if n_sides < 3:
         raise ValueError("Number of sides must be >= 3")
     # Circumradius R from side length s: s = 2 R sin(pi/n)
     R = side_len / (2 * math.sin(math.pi / n_sides))
-    pts = []
-    for k in range(n_sides):
-        theta = 2 * math.pi * k / n_sides
-        x = R * math.cos(theta)
-        y = R * math.sin(theta)
-        pts.append((x, y))
-    pts.append(pts[0])  # close the polygon
-    return pts
+    theta = 2 * np.pi * np.arange(n_sides) / n_sides
+    pts = np.column_stack((R * np.cos(theta), R * np.sin(theta)))
+    return np.vstack([pts, pts[:1]])  # close the polygon
 
 def koch_subdivide(p0, p1):
-    """Given segment p0->p1, return 5 points subdividing into 4 Koch segments: p0, a, peak, b, p1."""
-    (x0,y0),(x1,y1) = p0,p1
-    dx, dy = x1-x0, y1-y0
-    a = (x0 + dx/3.0, y0 + dy/3.0)
-    b = (x0 + 2*dx/3.0, y0 + 2*dy/3.0)
+    """Given (N,2) arrays of segment starts p0 and ends p1, return the interior Koch points (a, peak, b) of every segment."""
+    d = p1 - p0
+    u = d / 3.0
+    a = p0 + u
+    b = p0 + 2*d/3.0
     # Rotate (dx/3, dy/3) by +60 degrees around point a to get the 'peak'
-    ux, uy = dx/3.0, dy/3.0
-    cos60, sin60 = 0.5, math.sqrt(3)/2.0
-    px = a[0] + ux*cos60 - uy*sin60
-    py = a[1] + ux*sin60 + uy*cos60
-    peak = (px, py)
-    return [p0, a, peak, b, p1]
-
-def koch_iter(points):
-    """Apply one Koch iteration to a closed polyline (last==first)."""
-    new_pts = []
-    for i in range(len(points)-1):
-        seg_points = koch_subdivide(points[i], points[i+1])
-        new_pts.extend(seg_points[:-1])  # skip last to avoid duplicates
-    new_pts.append(new_pts[0])  # close
-    return new_pts
+    # Kept as (a + ux*cos) - uy*sin so rounding matches the scalar formula
+    peak = np.empty_like(a)
+    peak[:, 0] = a[:, 0] + u[:, 0]*_COS60 - u[:, 1]*_SIN60
+    peak[:, 1] = a[:, 1] + u[:, 0]*_SIN60 + u[:, 1]*_COS60
+    return a, peak, b
+
+def _koch_iter_scalar(pts, out):
+    """Scalar Koch iteration for numba; writes 4N+1 points into out and returns that view."""
+    n = pts.shape[0] - 1
+    for i in range(n):
+        x0, y0 = pts[i, 0], pts[i, 1]
+        x1, y1 = pts[i+1, 0], pts[i+1, 1]
+        ux, uy = (x1-x0)/3.0, (y1-y0)/3.0
+        ax, ay = x0 + ux, y0 + uy
+        j = 4*i
+        out[j, 0], out[j, 1] = x0, y0
+        out[j+1, 0], out[j+1, 1] = ax, ay
+        out[j+2, 0] = ax + ux*_COS60 - uy*_SIN60
+        out[j+2, 1] = ay + ux*_SIN60 + uy*_COS60
+        out[j+3, 0], out[j+3, 1] = x0 + 2*(x1-x0)/3.0, y0 + 2*(y1-y0)/3.0
+    out[4*n, 0], out[4*n, 1] = out[0, 0], out[0, 1]  # close
+    return out[:4*n + 1]
+
+@lru_cache(maxsize=None)
+def _load_koch_iter_nb():
+    """Import numba and compile the scalar kernel on first use; None if numba is unavailable."""
+    try:
+        from numba import njit
+    except Exception:
+        return None  # Falls back to the NumPy implementation
+    return njit("float64[:,:](float64[:,:], float64[:,:])")(_koch_iter_scalar)
+
+def koch_iter(points, out=None, use_jit=False):
+    """
+    Apply one Koch iteration to a closed polyline (last==first), returned as an (4N+1,2) array.
+    If out is given, the result is written into its first 4N+1 rows and that view is returned;
+    raises ValueError if out has fewer rows. use_jit selects the numba kernel when available.
+    """
+    pts = np.asarray(points, dtype=float)
+    n_out = 4*(len(pts) - 1) + 1
+    if out is None:
+        out = np.empty((n_out, 2))
+    elif len(out) < n_out:
+        # The numba kernel does not bounds-check, so a short buffer must be rejected here
+        raise ValueError(f"out has {len(out)} rows, need at least {n_out}")
+    else:
+        out = out[:n_out]
+    kernel = _load_koch_iter_nb() if use_jit else None
+    if kernel is not None:
+        return kernel(pts, out)
+
+    p0, p1 = pts[:-1], pts[1:]
+    a, peak, b = koch_subdivide(p0, p1)
+    out[0:-1:4] = p0
+    out[1::4] = a
+    out[2::4] = peak
+    out[3::4] = b
+    out[-1] = out[0]  # close
+    return out
 
 def generate_fractal(n_sides: int, side_len: float, depth: int):
     pts = regular_polygon(n_sides, side_len)
+    if depth == 0:
+        return pts
+
+    # Ping-pong between two preallocated buffers instead of allocating a new
+    # array per depth. Only the buffer receiving the last iteration needs the
+    # final size; the other one holds at most the depth-1 polyline.
+    final = np.empty((n_sides * 4**depth + 1, 2))
+    other = np.empty((n_sides * 4**(depth - 1) + 1, 2))
+    src, dst = (other, final) if depth % 2 else (final, other)
+    use_jit = n_sides * 4**depth >= NUMBA_MIN_SEGMENTS
+
+    n = len(pts)
+    src[:n] = pts
     for _ in range(depth):
-        pts = koch_iter(pts)
-    return pts
+        n = len(koch_iter(src[:n], out=dst, use_jit=use_jit))
+        src, dst = dst, src
+    return src[:n]
 
 def write_points(points, out_path):
+    # One "x,y" line per point: format everything with a single %-operation
+    # over plain Python floats, then write the text in one call
+    coords = np.asarray(points).ravel().tolist()
     with open(out_path, "w", encoding="utf-8") as f:
-        for x,y in points:
-            f.write(f"{x:.6f},{y:.6f}\n")
+        f.write(("%.6f,%.6f\n" * (len(coords) // 2)) % tuple(coords))
 
 def write_summary(n_sides, side_len, depth, points, out_path):
-    # segments = n_sides * 4^depth
-    segments = n_sides * (4 ** depth)
+    # The closed polyline already has n_sides * 4^depth segments
+    n_points = len(points)
+    segments = n_points - 1
     # Each new segment length = side_len / 3^depth
     seg_len = side_len / (3 ** depth) if depth >= 0 else float('nan')
     # Approximate perimeter
     perimeter = segments * seg_len
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write("Koch Fractal Summary\n")
-        f.write(f"Number of sides: {n_sides}\n")
-        f.write(f"Side length: {side_len}\n")
-        f.write(f"Depth: {depth}\n")
-        f.write(f"Segments: {segments}\n")
-        f.write(f"Segment length at depth: {seg_len}\n")
-        f.write(f"Approx perimeter: {perimeter}\n")
-        f.write(f"Points written: {len(points)}\n")
+    text = (
+        "Koch Fractal Summary\n"
+        f"Number of sides: {n_sides}\n"
+        f"Side length: {side_len}\n"
+        f"Depth: {depth}\n"
+        f"Segments: {segments}\n"
+        f"Segment length at depth: {seg_len}\n"
+        f"Approx perimeter: {perimeter}\n"
+        f"Points written: {n_points}\n"
+    )
+    Path(out_path).write_text(text, encoding="utf-8")
 
 def save_plot(points, out_path):
-    try:
-        import matplotlib.pyplot as plt
-    except Exception:
+    if plt is None:
         print("matplotlib not available — skipping PNG plot. (Install with: python -m pip install matplotlib)")
         return
 
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    plt.figure()
-    plt.plot(xs, ys)
-    plt.axis('equal')
-    plt.title("Koch Fractal")
-    plt.savefig(out_path, dpi=200, bbox_inches="tight")
+    pts = np.asarray(points)
+    if len(pts) > MAX_PLOT_POINTS:
+        stride = -(-len(pts) // MAX_PLOT_POINTS)  # ceil division
+        pts = np.vstack([pts[::stride], pts[-1:]])  # keep the closing point
+
+    fig, ax = plt.subplots()
+    ax.plot(pts[:, 0], pts[:, 1])
+    ax.axis('equal')
+    ax.set_title("Koch Fractal")
+    fig.savefig(out_path, dpi=200, bbox_inches="tight")
+    plt.close(fig)
     print(f"Wrote {out_path}")
 
 def parse_args():